@@ -147,9 +147,8 @@ function showScreen(screenId) {
     console.log('showScreen called with:', screenId);
 
     // Скрыть все экраны
-    document.querySelectorAll('.screen').forEach(screen => {
+    document.querySelectorAll('.screen.active').forEach(screen => {
         screen.classList.remove('active');
-        console.log('Removed active from:', screen.id);
     });
 
     // Показать нужный экран
@@ -213,7 +212,6 @@ function selectScenario(scenarioType) {
         localStorage.setItem('nadiUserName', 'Дмитрий');
         appState.userName = 'Дмитрий';
         showScreen('welcome');
-        updateWelcomeScreen();
     } else if (scenarioType === 'advanced') {
         // Продвинутый пользователь - развиваем существующую историю
         localStorage.setItem('nadiUserType', 'advanced');
@@ -222,7 +220,6 @@ function selectScenario(scenarioType) {
         appState.storiesCount = 5;
         appState.photosCount = 15;
         showScreen('welcome');
-        updateWelcomeScreen();
     }
 }
 
@@ -339,6 +336,7 @@ function selectTheme(themeId) {
 
     // Очистить чат
     document.getElementById('chatMessages').innerHTML = '';
+    chatStickToEnd = true;
 
     // Показать экран чата
     showScreen('chat');
@@ -369,6 +367,7 @@ function customTheme() {
         appState.exchangeCount = 0;
         appState.timeCount = 0;
         document.getElementById('chatMessages').innerHTML = '';
+        chatStickToEnd = true;
 
         showScreen('chat');
 
@@ -390,9 +389,27 @@ function customTheme() {
 }
 
 // Чат
+let chatScrollScheduled = false;
+let chatStickToEnd = true; // пользователь находится внизу переписки
+
+// Прокрутка чата вниз не чаще одного раза за кадр.
+// Если пользователь пролистал чат вверх, не сбиваем его (кроме force)
+function scrollChatToEnd(force = false) {
+    if (!force && !chatStickToEnd) return;
+    if (chatScrollScheduled) return;
+    chatScrollScheduled = true;
+
+    requestAnimationFrame(() => {
+        chatScrollScheduled = false;
+        const chatMessages = document.getElementById('chatMessages');
+        chatMessages.scrollTop = chatMessages.scrollHeight;
+    });
+}
+
 function addNadiMessage(text, hint = null) {
     const chatMessages = document.getElementById('chatMessages');
 
+    const time = getCurrentTime();
     const messageDiv = document.createElement('div');
     messageDiv.className = 'message nadi';
 
@@ -403,19 +420,20 @@ function addNadiMessage(text, hint = null) {
                 ${text}
                 ${hint ? `<div class="message-hint">💬 ${hint}</div>` : ''}
             </div>
-            <div class="message-time">${getCurrentTime()}</div>
+            <div class="message-time">${time}</div>
         </div>
     `;
 
     chatMessages.appendChild(messageDiv);
-    chatMessages.scrollTop = chatMessages.scrollHeight;
+    scrollChatToEnd();
 
-    appState.chatMessages.push({ type: 'nadi', text, time: getCurrentTime() });
+    appState.chatMessages.push({ type: 'nadi', text, time });
 }
 
 function addUserMessage(text) {
     const chatMessages = document.getElementById('chatMessages');
 
+    const time = getCurrentTime();
     const messageDiv = document.createElement('div');
     messageDiv.className = 'message user';
 
@@ -423,14 +441,14 @@ function addUserMessage(text) {
         <div class="message-avatar">👤</div>
         <div>
             <div class="message-bubble">${text}</div>
-            <div class="message-time">${getCurrentTime()}</div>
+            <div class="message-time">${time}</div>
         </div>
     `;
 
     chatMessages.appendChild(messageDiv);
-    chatMessages.scrollTop = chatMessages.scrollHeight;
+    scrollChatToEnd(true);
 
-    appState.chatMessages.push({ type: 'user', text, time: getCurrentTime() });
+    appState.chatMessages.push({ type: 'user', text, time });
     appState.exchangeCount++;
     updateChatStatus();
 }
@@ -456,7 +474,7 @@ function showTypingIndicator() {
     `;
 
     chatMessages.appendChild(typingDiv);
-    chatMessages.scrollTop = chatMessages.scrollHeight;
+    scrollChatToEnd();
 }
 
 function removeTypingIndicator() {
@@ -779,6 +797,15 @@ function logout() {
 document.addEventListener('DOMContentLoaded', () => {
     const userInput = document.getElementById('userInput');
     const sendButton = document.getElementById('sendButton');
+    const chatMessages = document.getElementById('chatMessages');
+
+    // Запоминаем, находится ли пользователь внизу чата
+    if (chatMessages) {
+        chatMessages.addEventListener('scroll', () => {
+            const distanceToEnd = chatMessages.scrollHeight - chatMessages.scrollTop - chatMessages.clientHeight;
+            chatStickToEnd = distanceToEnd < 40;
+        }, { passive: true });
+    }
 
     if (userInput && sendButton) {
         // Обработка Enter
@@ -833,9 +860,8 @@ function completeRegistration() {
     appState.userName = name;
     localStorage.setItem('nadiUserName', name);
 
-    // Перейти на welcome screen
+    // Перейти на welcome screen (showScreen сам обновляет его содержимое)
     showScreen('welcome');
-    updateWelcomeScreen();
 }
 
 // Функция скрытия нового splash screen